@@ -1,46 +1,143 @@
 """
 Configuration settings for the automation framework.
 Centralizes all configuration values for easy management.
+
+Environment variables are parsed once into an immutable Settings
+dataclass; legacy module-level names (e.g. ``from config.settings
+import DEFAULT_TIMEOUT``) keep working via PEP 562 ``__getattr__``.
 """
 import os
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
-
 # Project Paths
 BASE_DIR = Path(__file__).resolve().parent.parent
 CONFIG_DIR = BASE_DIR / "config"
 REPORTS_DIR = BASE_DIR / "reports"
 SCREENSHOTS_DIR = BASE_DIR / "screenshots"
+# Precomputed string prefix so hot paths can build screenshot paths by
+# concatenation instead of Path arithmetic
+SCREENSHOTS_STR = str(SCREENSHOTS_DIR) + os.sep
 TEST_RESULTS_DIR = BASE_DIR / "test-results"
+# Saved browser storage state used to warm up new contexts (cookies,
+# localStorage) so repeat navigations skip cold-start work
+STORAGE_STATE_PATH = BASE_DIR / ".pw-storage" / "storage_state.json"
+
+
+@lru_cache(maxsize=1)
+def _load_env() -> bool:
+    """Load environment variables from .env file (once per process)."""
+    return load_dotenv()
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Immutable snapshot of all environment-derived configuration."""
+
+    # Application Under Test
+    base_url: str
+
+    # Browser Configuration
+    browser_type: str  # chromium, firefox, webkit
+    headless: bool
+    slow_mo: int  # Slow down operations by ms
+    viewport_width: int
+    viewport_height: int
+
+    # Timeout Configuration (in milliseconds)
+    default_timeout: int
+    navigation_timeout: int
+    # Budget for wait_until_page_fully_loads (readyState + key elements)
+    page_load_timeout: int
+
+    # Test Execution
+    max_retries: int
+    parallel_workers: int
+
+    # Screenshots
+    screenshot_on_failure: bool
+
+    # Resource types aborted by BasePage.block_heavy_resources
+    block_resources: tuple
+
+    # Abort known analytics/chat-widget hosts during page loads
+    fast_load: bool
+
+    # Attach all xdist workers to one Chromium over CDP (Chromium only)
+    shared_browser: bool
+
+    # Logging
+    log_level: str
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Parse the environment once and return the cached Settings instance.
 
-# Application Under Test
-BASE_URL = os.getenv("BASE_URL", "https://trade.multibank.io/")
+    Returns:
+        Settings instance with all configuration values
+    """
+    _load_env()
+    return Settings(
+        base_url=os.getenv("BASE_URL", "https://trade.multibank.io/"),
+        browser_type=os.getenv("BROWSER", "chromium"),
+        headless=os.getenv("HEADLESS", "false").lower() == "true",
+        slow_mo=int(os.getenv("SLOW_MO", "0")),
+        viewport_width=int(os.getenv("VIEWPORT_WIDTH", "1920")),
+        viewport_height=int(os.getenv("VIEWPORT_HEIGHT", "1080")),
+        default_timeout=int(os.getenv("DEFAULT_TIMEOUT", "30000")),
+        navigation_timeout=int(os.getenv("NAVIGATION_TIMEOUT", "30000")),
+        page_load_timeout=int(os.getenv("PAGE_LOAD_TIMEOUT", "10000")),
+        max_retries=int(os.getenv("MAX_RETRIES", "2")),
+        # Default to cpu_count - 2: leaves headroom for the OS and the
+        # Playwright browser processes themselves
+        parallel_workers=int(
+            os.getenv("PARALLEL_WORKERS") or max(1, (os.cpu_count() or 2) - 2)
+        ),
+        screenshot_on_failure=os.getenv("SCREENSHOT_ON_FAILURE", "true").lower() == "true",
+        block_resources=tuple(
+            k for k in os.getenv("BLOCK_RESOURCES", "image,font,media").split(",") if k
+        ),
+        fast_load=os.getenv("FAST_LOAD", "false").lower() == "true",
+        shared_browser=os.getenv("SHARED_BROWSER", "false").lower() == "true",
+        log_level=os.getenv("LOG_LEVEL", "INFO"),
+    )
 
-# Browser Configuration
-BROWSER_TYPE = os.getenv("BROWSER", "chromium")  # chromium, firefox, webkit
-HEADLESS =  os.getenv("HEADLESS", "false").lower() == "true"
-SLOW_MO = int(os.getenv("SLOW_MO", "0"))  # Slow down operations by ms
-VIEWPORT_WIDTH = int(os.getenv("VIEWPORT_WIDTH", "1920"))
-VIEWPORT_HEIGHT = int(os.getenv("VIEWPORT_HEIGHT", "1080"))
 
-# Timeout Configuration (in milliseconds)
-DEFAULT_TIMEOUT = int(os.getenv("DEFAULT_TIMEOUT", "30000"))
-NAVIGATION_TIMEOUT = int(os.getenv("NAVIGATION_TIMEOUT", "30000"))
+# Legacy module-level constant names mapped to Settings fields
+_SETTINGS_ALIASES = {
+    "BASE_URL": "base_url",
+    "BROWSER_TYPE": "browser_type",
+    "HEADLESS": "headless",
+    "SLOW_MO": "slow_mo",
+    "VIEWPORT_WIDTH": "viewport_width",
+    "VIEWPORT_HEIGHT": "viewport_height",
+    "DEFAULT_TIMEOUT": "default_timeout",
+    "NAVIGATION_TIMEOUT": "navigation_timeout",
+    "PAGE_LOAD_TIMEOUT": "page_load_timeout",
+    "MAX_RETRIES": "max_retries",
+    "PARALLEL_WORKERS": "parallel_workers",
+    "SCREENSHOT_ON_FAILURE": "screenshot_on_failure",
+    "BLOCK_RESOURCES": "block_resources",
+    "FAST_LOAD": "fast_load",
+    "SHARED_BROWSER": "shared_browser",
+    "LOG_LEVEL": "log_level",
+}
 
-# Test Execution
-MAX_RETRIES = int(os.getenv("MAX_RETRIES", "2"))
-PARALLEL_WORKERS = int(os.getenv("PARALLEL_WORKERS", "1"))
 
-# Screenshots
-SCREENSHOT_ON_FAILURE = os.getenv("SCREENSHOT_ON_FAILURE", "true").lower() == "true"
+def __getattr__(name: str):
+    """Resolve legacy constant names against the cached Settings (PEP 562)."""
+    field = _SETTINGS_ALIASES.get(name)
+    if field is not None:
+        return getattr(get_settings(), field)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Logging
-LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 
-# Create directories if they don't exist
-REPORTS_DIR.mkdir(exist_ok=True)
-SCREENSHOTS_DIR.mkdir(exist_ok=True)
-TEST_RESULTS_DIR.mkdir(exist_ok=True)
\ No newline at end of file
+@lru_cache(maxsize=None)
+def _ensure_dir(path: Path) -> Path:
+    """Create a directory on first use (once per process) and return it."""
+    path.mkdir(parents=True, exist_ok=True)
+    return path
@@ -2,13 +2,56 @@
 Base Page class containing common methods for all page objects.
 Implements POM pattern with Playwright.
 """
-from playwright.sync_api import Page, expect
+from playwright.sync_api import Page, TimeoutError as PWTimeoutError
 from pathlib import Path
+from itertools import count
+import atexit
+import base64
 import logging
-from config.settings import DEFAULT_TIMEOUT, SCREENSHOTS_DIR
+import queue
+import re
+import threading
+import time
+from config.settings import (
+    BLOCK_RESOURCES,
+    DEFAULT_TIMEOUT,
+    PAGE_LOAD_TIMEOUT,
+    SCREENSHOTS_DIR,
+    SCREENSHOTS_STR,
+    _ensure_dir,
+)
 
 logger = logging.getLogger(__name__)
 
+# Monotonic suffix so screenshots taken within the same second don't collide
+_shot_seq = count()
+
+# Simple single-tag XPath like '//nav' — cheaper to probe as CSS
+_XPATH_SIMPLE = re.compile(r"^//([a-zA-Z][\w-]*)$")
+
+# Background writer so the disk write of screenshots happens off the
+# test thread; only the browser-side encode stays on the critical path.
+_writer_q = queue.Queue()
+
+
+def _drain_screenshots():
+    while True:
+        path, data = _writer_q.get()
+        try:
+            with open(path, "wb") as f:
+                f.write(data)
+        except OSError as e:
+            logger.error("Failed to write screenshot %s: %s", path, e)
+        finally:
+            _writer_q.task_done()
+
+
+threading.Thread(target=_drain_screenshots, daemon=True,
+                 name="screenshot-writer").start()
+
+# Flush pending screenshots before the interpreter exits
+atexit.register(_writer_q.join)
+
 
 class BasePage:
     """
@@ -25,17 +68,68 @@ class BasePage:
         """
         self.page = page
         self.timeout = DEFAULT_TIMEOUT
-        logger.info(f"Initialized {self.__class__.__name__}")
+        self._loc_cache = {}
+        self._cdp = None  # Lazily attached CDP session (Chromium only)
+        logger.info("Initialized %s", self.__class__.__name__)
+
+    def _loc(self, selector: str):
+        """
+        Return a cached Locator for the selector.
+        Playwright locators are lazy handles, so reusing them avoids
+        re-allocating a wrapper per call. The cache is cleared on navigate().
+        """
+        loc = self._loc_cache.get(selector)
+        if loc is None:
+            loc = self.page.locator(selector)
+            self._loc_cache[selector] = loc
+        return loc
+
+    def block_heavy_resources(self, kinds: tuple = None):
+        """
+        Abort image/font/media requests for tests that don't assert pixels.
+        Cuts per-navigation bytes dramatically on asset-heavy pages; leave
+        unset for visual tests.
+
+        Args:
+            kinds: Resource types to abort (defaults to settings.BLOCK_RESOURCES)
+        """
+        if kinds is None:
+            kinds = BLOCK_RESOURCES
+        blocked = set(kinds)
+        logger.info("Blocking heavy resources: %s", sorted(blocked))
+        self.page.route(
+            "**/*",
+            lambda route: route.abort()
+            if route.request.resource_type in blocked
+            else route.continue_(),
+        )
 
-    def navigate(self, url: str):
+    @staticmethod
+    def _normalize_selector(selector: str) -> str:
+        """
+        Rewrite a simple single-tag XPath ('//nav') to its CSS form
+        ('nav'); querySelector is noticeably faster than document.evaluate
+        for plain tag probes. Anything more complex is returned unchanged.
+        """
+        match = _XPATH_SIMPLE.match(selector)
+        return match.group(1) if match else selector
+
+    def navigate(self, url: str, wait_until: str = "commit"):
         """
         Navigate to a specific URL.
+        Defaults to wait_until="commit" (returns once the navigation
+        response is received) so DOM parsing overlaps with the caller's
+        own wait — the idiom is navigate(url) followed by
+        wait_until_loaded/wait_until_page_fully_loads on key elements.
 
         Args:
             url: URL to navigate to
+            wait_until: Playwright load event to await (commit,
+                        domcontentloaded, load, networkidle)
         """
-        logger.info(f"Navigating to: {url}")
-        self.page.goto(url, wait_until="domcontentloaded", timeout=self.timeout)
+        logger.info("Navigating to: %s", url)
+        self._loc_cache.clear()
+        self.page.goto(url, wait_until=wait_until, timeout=self.timeout)
 
     def click(self, locator: str):
         """
@@ -44,8 +138,8 @@ class BasePage:
         Args:
             locator: CSS selector or other locator string
         """
-        logger.info(f"Clicking element: {locator}")
-        self.page.locator(locator).click(timeout=self.timeout)
+        logger.info("Clicking element: %s", locator)
+        self._loc(locator).click(timeout=self.timeout)
 
     def fill(self, locator: str, text: str):
         """
@@ -55,8 +149,36 @@ class BasePage:
             locator: CSS selector or other locator string
             text: Text to enter
         """
-        logger.info(f"Filling '{locator}' with text")
-        self.page.locator(locator).fill(text, timeout=self.timeout)
+        logger.info("Filling '%s' with text", locator)
+        self._loc(locator).fill(text, timeout=self.timeout)
+
+    def fill_form(self, fields: dict):
+        """
+        Fill multiple input fields in a single browser round-trip.
+        Sets each value through the native value setter and dispatches
+        input/change events so framework-controlled inputs (React/Vue)
+        pick the change up. Use fill() for single fields that need
+        Playwright's actionability checks.
+
+        Args:
+            fields: Mapping of CSS selector -> value to enter
+        """
+        logger.info("Filling %d form fields in one call", len(fields))
+        self.page.evaluate(
+            """(pairs) => {
+                for (const [sel, val] of pairs) {
+                    const el = document.querySelector(sel);
+                    if (!el) throw new Error('fill_form: no element for ' + sel);
+                    const proto = el.tagName === 'TEXTAREA'
+                        ? HTMLTextAreaElement.prototype
+                        : HTMLInputElement.prototype;
+                    Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, val);
+                    el.dispatchEvent(new Event('input', { bubbles: true }));
+                    el.dispatchEvent(new Event('change', { bubbles: true }));
+                }
+            }""",
+            list(fields.items()),
+        )
 
     def get_text(self, locator: str) -> str:
         """
@@ -68,36 +190,143 @@ class BasePage:
         Returns:
             Text content of the element
         """
-        element = self.page.locator(locator).first
+        element = self._loc(locator).first
         return element.text_content(timeout=self.timeout)
 
     def get_all_text(self, locator: str) -> list:
         """
         Get text content from all matching elements.
+        Runs a single evaluate_all in the browser instead of one
+        round-trip per element.
+
+        Args:
+            locator: CSS selector or other locator string
+
+        Returns:
+            List of non-empty text contents
+        """
+        return self._loc(locator).evaluate_all(
+            "els => els.map(e => (e.textContent || '').trim()).filter(t => t.length > 0)"
+        )
+
+    def get_all_text_fast(self, locator: str) -> list:
+        """
+        Get visible text (innerText) from all matching elements in one
+        call, stripped and filtered browser-side. Unlike get_all_text
+        (textContent), this matches what the user actually sees, so
+        callers don't need a Python-side strip/filter pass.
 
         Args:
             locator: CSS selector or other locator string
 
         Returns:
-            List of text contents
+            List of non-empty visible text strings
         """
-        elements = self.page.locator(locator).all()
-        return [elem.text_content() for elem in elements if elem.text_content()]
+        return self._loc(locator).evaluate_all(
+            "els => els.map(e => (e.innerText || '').trim()).filter(Boolean)"
+        )
 
-    def is_visible(self, locator: str, timeout: int = 5000) -> bool:
+    def get_all_attributes(self, locator: str, attribute: str) -> list:
+        """
+        Get an attribute value from all matching elements in one call.
+
+        Args:
+            locator: CSS selector or other locator string
+            attribute: Attribute name
+
+        Returns:
+            List of attribute values (None for elements missing the attribute)
+        """
+        return self._loc(locator).evaluate_all(
+            "(els, attr) => els.map(e => e.getAttribute(attr))", attribute
+        )
+
+    def describe(self, locator: str, attrs: list = ()) -> dict:
+        """
+        Probe count, first-element text/visibility and attributes in a
+        single browser call. Preferred over chaining get_element_count +
+        get_text + get_attribute, which costs one round-trip each.
+
+        Args:
+            locator: CSS selector or other locator string
+            attrs: Attribute names to read from the first element
+
+        Returns:
+            Dict with 'count', 'first_text', 'first_visible' and 'attrs'
+        """
+        return self._loc(locator).evaluate_all(
+            """(els, attrs) => ({
+                count: els.length,
+                first_text: els[0] ? (els[0].textContent || '').trim() : null,
+                first_visible: els[0] ? !!els[0].offsetParent : false,
+                attrs: els[0]
+                    ? Object.fromEntries(attrs.map(a => [a, els[0].getAttribute(a)]))
+                    : {}
+            })""",
+            list(attrs),
+        )
+
+    def batch_probe(self, spec: dict) -> dict:
+        """
+        Run several visibility/count probes in one browser call.
+        Five sequential is_visible/get_element_count calls cost five
+        CDP round-trips; this fuses them into a single evaluate.
+
+        Args:
+            spec: {name: {"selector": str, "op": "count" | "visible"}};
+                  selectors may be XPath (//...) or CSS
+
+        Returns:
+            Dict mapping each name to its count (int) or visibility (bool)
+        """
+        return self.page.evaluate(
+            """(spec) => {
+                const find = (sel) => {
+                    if (sel.startsWith('//') || sel.startsWith('(')) {
+                        const snap = document.evaluate(
+                            sel, document, null,
+                            XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+                        );
+                        const els = [];
+                        for (let i = 0; i < snap.snapshotLength; i++)
+                            els.push(snap.snapshotItem(i));
+                        return els;
+                    }
+                    return Array.from(document.querySelectorAll(sel));
+                };
+                const result = {};
+                for (const name in spec) {
+                    const els = find(spec[name].selector);
+                    result[name] = spec[name].op === 'count'
+                        ? els.length
+                        : els.length > 0 && !!els[0].offsetParent;
+                }
+                return result;
+            }""",
+            spec,
+        )
+
+    def is_visible(self, locator: str, timeout: int = 0) -> bool:
         """
         Check if element is visible on the page.
 
         Args:
             locator: CSS selector or other locator string
-            timeout: Maximum time to wait (default 5 seconds)
+            timeout: Optional wait in ms; 0 (default) probes immediately
 
         Returns:
             True if visible, False otherwise
         """
+        loc = self._loc(locator).first
+        if timeout <= 0:
+            # Instant probe: is_visible returns a bool without waiting
+            # or raising, so negative checks cost nothing
+            return loc.is_visible()
         try:
-            return self.page.locator(locator).first.is_visible(timeout=timeout)
-        except Exception:
+            loc.wait_for(state="visible", timeout=timeout)
+            return True
+        except PWTimeoutError:
+            # Only timeouts mean "not visible"; selector errors still propagate
             return False
 
     def wait_for_element(self, locator: str, state: str = "visible"):
@@ -108,8 +337,8 @@ class BasePage:
             locator: CSS selector or other locator string
             state: Element state (visible, hidden, attached, detached)
         """
-        logger.info(f"Waiting for element '{locator}' to be {state}")
-        self.page.locator(locator).first.wait_for(state=state, timeout=self.timeout)
+        logger.info("Waiting for element '%s' to be %s", locator, state)
+        self._loc(locator).first.wait_for(state=state, timeout=self.timeout)
 
     def scroll_to_element(self, locator: str, align_to_top: bool = True):
         """
@@ -119,8 +348,8 @@ class BasePage:
             locator: XPath or CSS selector
             align_to_top: If True, align element to top of viewport
         """
-        logger.info(f"Scrolling page to element: {locator}")
-        element = self.page.locator(locator).first
+        logger.info("Scrolling page to element: %s", locator)
+        element = self._loc(locator).first
 
         # Use JavaScript scrollIntoView for reliable scrolling
         block = "start" if align_to_top else "center"
@@ -140,26 +369,71 @@ class BasePage:
         Returns:
             Attribute value
         """
-        return self.page.locator(locator).first.get_attribute(attribute, timeout=self.timeout)
+        return self._loc(locator).first.get_attribute(attribute, timeout=self.timeout)
 
-    def take_screenshot(self, name: str = None) -> Path:
+    def take_screenshot(self, name: str = None, *, full_page: bool = False,
+                        fmt: str = "jpeg", quality: int = 70) -> Path:
         """
         Take a screenshot of the current page.
+        Defaults to a viewport-only JPEG, which is much cheaper to render
+        and store than a full-page PNG; pass full_page=True, fmt="png"
+        for pixel-perfect debug captures.
 
         Args:
             name: Screenshot filename (without extension)
+            full_page: Capture the whole scrollable page instead of the viewport
+            fmt: Image format ("jpeg" or "png")
+            quality: JPEG quality 0-100 (ignored for PNG)
 
         Returns:
             Path to the screenshot file
         """
         if name is None:
-            from datetime import datetime
-            name = f"screenshot_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            name = f"screenshot_{time.strftime('%Y%m%d_%H%M%S')}_{next(_shot_seq)}"
+
+        _ensure_dir(SCREENSHOTS_DIR)
+        # String concatenation on the precomputed prefix avoids per-call
+        # Path allocation and re-normalization
+        path_str = f"{SCREENSHOTS_STR}{name}.{fmt}"
+        logger.info("Taking screenshot: %s", path_str)
+        data = None
+        if not full_page:
+            # Chromium fast path: one CDP call, no scroll-and-stitch
+            data = self._cdp_screenshot(fmt, quality)
+        if data is None:
+            data = self.page.screenshot(
+                full_page=full_page,
+                type=fmt,
+                quality=quality if fmt == "jpeg" else None,
+                animations="disabled",
+                caret="hide",
+            )
+        # Defer the disk write to the background writer thread
+        _writer_q.put((path_str, data))
+        return Path(path_str)
 
-        screenshot_path = SCREENSHOTS_DIR / f"{name}.png"
-        logger.info(f"Taking screenshot: {screenshot_path}")
-        self.page.screenshot(path=str(screenshot_path), full_page=True)
-        return screenshot_path
+    def _cdp_screenshot(self, fmt: str, quality: int):
+        """
+        Capture the viewport via a raw CDP Page.captureScreenshot call.
+        Skips Playwright's tile-stitching entirely; returns None on
+        non-Chromium browsers so callers fall back to page.screenshot.
+        """
+        try:
+            browser = self.page.context.browser
+            if browser is None or browser.browser_type.name != "chromium":
+                return None
+            if self._cdp is None:
+                self._cdp = self.page.context.new_cdp_session(self.page)
+            params = {"format": fmt, "captureBeyondViewport": False}
+            if fmt == "jpeg":
+                params["quality"] = quality
+            return base64.b64decode(
+                self._cdp.send("Page.captureScreenshot", params)["data"]
+            )
+        except Exception as e:
+            logger.warning("CDP screenshot failed, falling back: %s", e)
+            self._cdp = None
+            return None
 
     def wait_for_load_state(self, state: str = "load"):
         """
@@ -168,7 +442,7 @@ class BasePage:
         Args:
             state: Load state (load, domcontentloaded, networkidle)
         """
-        logger.info(f"Waiting for load state: {state}")
+        logger.info("Waiting for load state: %s", state)
         self.page.wait_for_load_state(state, timeout=self.timeout)
 
     def wait_until_loaded(self, selector: str = None, timeout: int = None):
@@ -184,12 +458,22 @@ class BasePage:
 
         logger.info("Waiting for page to be fully loaded")
 
+        # Fast path: if the target selector is already rendered (e.g. a
+        # client-side route transition), skip the load-state round-trip
+        if selector:
+            try:
+                self.page.wait_for_selector(selector, state="visible", timeout=250)
+                logger.info("Page loaded successfully (selector already present)")
+                return
+            except PWTimeoutError:
+                pass
+
         # Strategy 1: Wait for DOM
         self.page.wait_for_load_state("domcontentloaded", timeout=timeout)
 
         # Strategy 2: If selector provided, wait for it
         if selector:
-            logger.info(f"Waiting for element: {selector}")
+            logger.info("Waiting for element: %s", selector)
             self.page.wait_for_selector(selector, state="visible", timeout=timeout)
 
         logger.info("Page loaded successfully")
@@ -202,51 +486,58 @@ class BasePage:
         Args:
             key_elements: List of critical element selectors that indicate page is ready
                          (e.g., ['//nav', '//footer', '//main'])
-            timeout: Optional timeout in milliseconds
+            timeout: Optional timeout in milliseconds (default: PAGE_LOAD_TIMEOUT)
 
         Strategy:
         1. Wait for DOM to be ready
-        2. Wait for document.readyState === 'complete'
-        3. Wait for all key elements to be visible
+        2. Single browser-side poll for document.readyState === 'complete'
+           AND all key elements visible (one wait_for_function instead of
+           one round-trip per element)
 
         Example:
             page.wait_until_page_fully_loads(key_elements=['//nav', '//main'])
         """
         if timeout is None:
-            timeout = self.timeout
+            # Tighter than DEFAULT_TIMEOUT: a page that isn't complete
+            # within this budget should fail fast, not hang the test
+            timeout = PAGE_LOAD_TIMEOUT
 
         logger.info("Starting comprehensive page load wait")
 
         try:
             # Strategy 1: Wait for DOM content to load
-            logger.info("Step 1/3: Waiting for DOM content")
+            logger.info("Step 1/2: Waiting for DOM content")
             self.page.wait_for_load_state("domcontentloaded", timeout=timeout)
 
-            # Strategy 2: Wait for document.readyState to be 'complete'
-            logger.info("Step 2/3: Waiting for document.readyState === 'complete'")
+            # Strategy 2: One browser-side poll covering readyState + all key
+            # elements. Supports both CSS and XPath ('//...') selectors.
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Step 2/2: Waiting for readyState === 'complete' "
+                    "and %d key elements",
+                    len(key_elements) if key_elements else 0,
+                )
             self.page.wait_for_function(
-                "document.readyState === 'complete'",
-                timeout=timeout
+                """(sels) => {
+                    if (document.readyState !== 'complete') return false;
+                    const find = (s) => s.startsWith('//') || s.startsWith('(')
+                        ? document.evaluate(s, document, null,
+                            XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+                        : document.querySelector(s);
+                    return sels.every(s => {
+                        const el = find(s);
+                        return el && el.offsetParent !== null;
+                    });
+                }""",
+                arg=[self._normalize_selector(s) for s in (key_elements or [])],
+                timeout=timeout,
+                polling=100,
             )
 
-            # Strategy 3: Wait for key elements if provided
-            if key_elements:
-                logger.info(f"Step 3/3: Waiting for {len(key_elements)} key elements")
-                for idx, element in enumerate(key_elements, 1):
-                    logger.info(f"  [{idx}/{len(key_elements)}] Waiting for: {element}")
-                    self.page.wait_for_selector(
-                        element,
-                        state="visible",
-                        timeout=timeout
-                    )
-            else:
-                logger.info("Step 3/3: No key elements specified, skipping")
-
-
-            logger.info("✓ Page fully loaded successfully")
+            logger.info("[OK] Page fully loaded successfully")
 
         except Exception as e:
-            logger.error(f"Page load wait failed: {e}")
+            logger.error("Page load wait failed: %s", e)
             raise
 
     def get_current_url(self) -> str:
@@ -264,8 +555,8 @@ class BasePage:
         Args:
             locator: CSS selector or other locator string
         """
-        logger.info(f"Hovering over: {locator}")
-        self.page.locator(locator).first.hover(timeout=self.timeout)
+        logger.info("Hovering over: %s", locator)
+        self._loc(locator).first.hover(timeout=self.timeout)
 
     def get_element_count(self, locator: str) -> int:
         """
@@ -277,7 +568,7 @@ class BasePage:
         Returns:
             Number of matching elements
         """
-        return self.page.locator(locator).count()
+        return self._loc(locator).count()
 
     def get_visible_element_count(self, locator: str) -> int:
         """
@@ -290,7 +581,7 @@ class BasePage:
         Returns:
             Number of visible elements
         """
-        all_elements = self.page.locator(locator).all()
+        all_elements = self._loc(locator).all()
         visible_count = sum(1 for el in all_elements if el.is_visible())
         return visible_count
 
@@ -301,7 +592,7 @@ class BasePage:
         Args:
             url_pattern: URL pattern to match
         """
-        logger.info(f"Waiting for URL: {url_pattern}")
+        logger.info("Waiting for URL: %s", url_pattern)
         self.page.wait_for_url(url_pattern, timeout=self.timeout)
 
     @staticmethod
@@ -4,26 +4,29 @@ Loads locators from locators.json
 """
 from utils.locator_reader import LOCATORS
 
+_locators = LOCATORS["Home Page"]
 
-class HomeLocators:
-    """Locators for Home Page - Playwright compatible"""
 
-    def __init__(self):
-        locators = LOCATORS["Home Page"]
+class HomeLocators:
+    """
+    Locators for Home Page - Playwright compatible.
+    Resolved once at import as class attributes, so constructing the
+    class per page object costs nothing.
+    """
 
-        # One-liner locator assignments (clean and maintainable)
-        self.nav_menu = locators["nav_menu"]["locator"]
-        self.nav_items = locators["nav_items"]["locator"]
-        self.nav_item_by_text = locators["nav_item_by_text"]["locator"]
-        self.nav_dropdown_links = locators["nav_dropdown_links"]["locator"]
-        self.spot_trade = locators["spot_trade"]["locator"]
-        self.category_tabs = locators["category_tabs"]["locator"]
-        self.category_tab_name = locators["category_tab_name"]["locator"]
-        self.trading_pairs = locators["trading_pairs"]["locator"]
-        self.change_direction = locators["change_direction"]["locator"]
-        self.banner_section = locators["banner_section"]["locator"]
-        self.banner_items = locators["banner_items"]["locator"]
-        self.app_store_link = locators["app_store_link"]["locator"]
-        self.google_play_link = locators["google_play_link"]["locator"]
-        self.about_us_nav = locators["about_us_nav"]["locator"]
-        self.why_multibank = locators["why_multibank"]["locator"]
\ No newline at end of file
+    # One-liner locator assignments (clean and maintainable)
+    nav_menu = _locators["nav_menu"]["locator"]
+    nav_items = _locators["nav_items"]["locator"]
+    nav_item_by_text = _locators["nav_item_by_text"]["locator"]
+    nav_dropdown_links = _locators["nav_dropdown_links"]["locator"]
+    spot_trade = _locators["spot_trade"]["locator"]
+    category_tabs = _locators["category_tabs"]["locator"]
+    category_tab_name = _locators["category_tab_name"]["locator"]
+    trading_pairs = _locators["trading_pairs"]["locator"]
+    change_direction = _locators["change_direction"]["locator"]
+    banner_section = _locators["banner_section"]["locator"]
+    banner_items = _locators["banner_items"]["locator"]
+    app_store_link = _locators["app_store_link"]["locator"]
+    google_play_link = _locators["google_play_link"]["locator"]
+    about_us_nav = _locators["about_us_nav"]["locator"]
+    why_multibank = _locators["why_multibank"]["locator"]
@@ -4,30 +4,36 @@ Loads locators from locators.json
 """
 from utils.locator_reader import LOCATORS
 
+_locators = LOCATORS["Why Multibank Page"]
 
-class WhyMultibankLocators:
-    """Locators for Home Page - Playwright compatible"""
-
-    def __init__(self):
-        locators = LOCATORS["Why Multibank Page"]
-
-        # Hero Banner Carousel
-        self.hero_carousel = locators["hero_carousel"]["locator"]
-        self.hero_slides = locators["hero_slides"]["locator"]
-
-        # Our Advantages Section
-        self.advantages_section = locators["advantages_section"]["locator"]
-        self.advantages_subtitle_h5 = locators["advantages_subtitle_h5"]["locator"]
-        self.advantages_title_h2 = locators["advantages_title_h2"]["locator"]
-
-        # Advantage Cards
-        self.advantage_cards = locators["advantage_cards"]["locator"]
-        self.card_fiat = locators["card_fiat"]["locator"]
-        self.card_regulated = locators["card_regulated"]["locator"]
-        self.card_security = locators["card_security"]["locator"]
-        self.card_crypto = locators["card_crypto"]["locator"]
-        self.card_service = locators["card_service"]["locator"]
-
-        # Trading Opportunity Section
-        self.trading_opportunity_h3 = locators["trading_opportunity_h3"]["locator"]
 
+class WhyMultibankLocators:
+    """
+    Locators for Why Multibank Page - Playwright compatible.
+    Resolved once at import as class attributes, so constructing the
+    class per page object costs nothing.
+    """
+
+    # Hero Banner Carousel
+    hero_carousel = _locators["hero_carousel"]["locator"]
+    hero_slides = _locators["hero_slides"]["locator"]
+    # Combined parent//child XPath: resolves in one locator query
+    # instead of chaining locator().locator(). Both halves must stay
+    # in the same engine (XPath) for the concatenation to be valid.
+    hero_slide_h2 = f"{hero_slides}//h2"
+
+    # Our Advantages Section
+    advantages_section = _locators["advantages_section"]["locator"]
+    advantages_subtitle_h5 = _locators["advantages_subtitle_h5"]["locator"]
+    advantages_title_h2 = _locators["advantages_title_h2"]["locator"]
+
+    # Advantage Cards
+    advantage_cards = _locators["advantage_cards"]["locator"]
+    card_fiat = _locators["card_fiat"]["locator"]
+    card_regulated = _locators["card_regulated"]["locator"]
+    card_security = _locators["card_security"]["locator"]
+    card_crypto = _locators["card_crypto"]["locator"]
+    card_service = _locators["card_service"]["locator"]
+
+    # Trading Opportunity Section
+    trading_opportunity_h3 = _locators["trading_opportunity_h3"]["locator"]
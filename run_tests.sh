@@ -6,9 +6,16 @@ if [ -f .env ]; then
     export $(cat .env | grep -v '^#' | xargs)
 fi
 
-# Use PARALLEL_WORKERS if set, otherwise default to 1
-WORKERS=${PARALLEL_WORKERS:-1}
+# Use PARALLEL_WORKERS if set, otherwise default to cpu_count - 2
+# (reserve two cores for the OS and the browser processes)
+CPUS=$(nproc 2>/dev/null || echo 2)
+DEFAULT_WORKERS=$(( CPUS > 3 ? CPUS - 2 : 1 ))
+WORKERS=${PARALLEL_WORKERS:-$DEFAULT_WORKERS}
 RETRIES=${MAX_RETRIES:-0}
+# worksteal lets idle workers pull tests from slow files (perf tests
+# run much longer than the unit tests); set XDIST_DIST=loadfile to pin
+# each file to one worker instead
+DIST=${XDIST_DIST:-worksteal}
 
 # Build pytest command
 PYTEST_CMD="pytest"
@@ -16,7 +23,7 @@ PYTEST_CMD="pytest"
 # Add parallel workers if > 1
 if [ "$WORKERS" -gt 1 ]; then
     echo "🚀 Running tests with $WORKERS parallel workers..."
-    PYTEST_CMD="$PYTEST_CMD -n $WORKERS --dist load"
+    PYTEST_CMD="$PYTEST_CMD -n $WORKERS --dist $DIST"
 else
     echo "🔄 Running tests sequentially..."
 fi
@@ -3,7 +3,10 @@ Pytest configuration and fixtures for the test suite.
 Contains shared fixtures used across all tests.
 """
 import pytest
+import fcntl
 import logging
+import os
+import re
 from playwright.sync_api import Page, Browser
 from config.settings import (
     BASE_URL,
@@ -11,22 +14,45 @@ from config.settings import (
     HEADLESS,
     VIEWPORT_WIDTH,
     VIEWPORT_HEIGHT,
-    SCREENSHOT_ON_FAILURE
+    SCREENSHOT_ON_FAILURE,
+    STORAGE_STATE_PATH,
+    _ensure_dir
 )
 from pages.home_page import HomePage
 from pages.why_multibank_page import WhyMultibankPage
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Configure logging: records go through a queue and are written by a
+# background listener thread, keeping log I/O off the test thread
+from utils.logging_setup import setup_queue_logging
+
+setup_queue_logging()
 logger = logging.getLogger(__name__)
 
+# Resource types aborted in the page fixture. The tests never assert on
+# pixels, so skipping these cuts bytes-on-the-wire and load time; tests
+# that do need rendered assets can opt out with @pytest.mark.needs_assets
+
+# Third-party hosts aborted at the context level for every test —
+# analytics/ads requests slow loads and skew performance measurements
+THIRD_PARTY_BLOCKLIST = re.compile(
+    r"(googletagmanager|google-analytics|hotjar|doubleclick|segment\.io)"
+)
+
+BLOCKED_RESOURCE_TYPES = {
+    "image",
+    "stylesheet",
+    "font",
+    "media",
+    "beacon",
+    "csp_report",
+    "imageset",
+}
+
 
 @pytest.fixture(scope="session")
 def browser_type_launch_args():
     """Browser launch arguments."""
+    import os
     import platform
 
     args = []
@@ -34,6 +60,19 @@ def browser_type_launch_args():
     # Add maximize in headed mode
     if not HEADLESS:
         args.append("--start-fullscreen")
+        # CI machines have no display; catch a misconfigured HEADLESS
+        # early instead of failing on launch
+        if os.getenv("CI"):
+            raise RuntimeError("Headed mode requested in CI — set HEADLESS=true")
+    else:
+        # Trim Chromium background work the tests never rely on
+        args.extend([
+            "--disable-dev-shm-usage",
+            "--disable-extensions",
+            "--no-sandbox",
+            "--disable-background-networking",
+            "--disable-features=Translate,BackForwardCache",
+        ])
 
     return {
         "headless": HEADLESS,
@@ -50,21 +89,165 @@ def browser_context_args():
     }
 
 
+@pytest.fixture(scope="session")
+def browser(playwright, browser_name, browser_type_launch_args) -> Browser:
+    """
+    Session browser, overriding pytest-playwright's default.
+    With SHARED_BROWSER=true (Chromium only), every xdist worker
+    attaches to one shared Chromium over CDP instead of launching its
+    own — N workers share one browser's RAM/CPU; contexts stay fully
+    isolated per worker. Otherwise launches normally.
+    """
+    from config.settings import SHARED_BROWSER
+
+    browser_type = getattr(playwright, browser_name)
+
+    if SHARED_BROWSER and browser_name == "chromium":
+        from utils import shared_browser
+
+        endpoint = shared_browser.acquire(browser_type.executable_path)
+        browser = playwright.chromium.connect_over_cdp(endpoint)
+        yield browser
+        browser.close()  # disconnect only; the process is refcounted
+        shared_browser.release()
+    else:
+        browser = browser_type.launch(**browser_type_launch_args)
+        yield browser
+        browser.close()
+
+
+@pytest.fixture(scope="session")
+def browser_for_type(playwright):
+    """
+    Launch at most one browser per engine per worker and hand out the
+    cached instance, so cross-browser parametrizations don't pay a
+    fresh browser launch each. All launched browsers are closed at
+    session end.
+    """
+    browsers = {}
+
+    def _get(browser_type: str) -> Browser:
+        if browser_type not in browsers:
+            logger.info(f"Launching {browser_type} for cross-browser tests")
+            browsers[browser_type] = getattr(playwright, browser_type).launch(headless=True)
+        return browsers[browser_type]
+
+    yield _get
+
+    for launched in browsers.values():
+        launched.close()
+
+
+@pytest.fixture(scope="session")
+def warm_up_browser_cache(browser: Browser, browser_context_args):
+    """
+    Prime browser storage state once per worker.
+    Loads BASE_URL in a throwaway context and saves cookies/localStorage
+    to STORAGE_STATE_PATH so later contexts start warm instead of paying
+    the full cold-start on their first navigation. shared_context depends
+    on this fixture, so the state is primed before the suite's first test.
+    """
+    # flock serializes the check-and-write across xdist workers (same
+    # pattern as utils.shared_browser) so only the first cold worker
+    # navigates and no worker ever reads a half-written file
+    _ensure_dir(STORAGE_STATE_PATH.parent)
+    with open(STORAGE_STATE_PATH.with_suffix(".lock"), "w") as lock_fh:
+        fcntl.flock(lock_fh, fcntl.LOCK_EX)
+        try:
+            if not STORAGE_STATE_PATH.exists():
+                logger.info("Warming up browser cache against %s", BASE_URL)
+                context = browser.new_context(**browser_context_args)
+                page = context.new_page()
+                try:
+                    page.goto(BASE_URL, wait_until="domcontentloaded")
+                    # Write to a temp file and rename: os.replace is
+                    # atomic, so readers see the old state or the new
+                    # one, never a torn JSON
+                    tmp_path = STORAGE_STATE_PATH.with_suffix(".tmp")
+                    context.storage_state(path=str(tmp_path))
+                    os.replace(tmp_path, STORAGE_STATE_PATH)
+                except Exception as e:
+                    # A failed warm-up only costs the optimization, not the run
+                    logger.warning(f"Browser cache warm-up failed: {e}")
+                finally:
+                    page.close()
+                    context.close()
+        finally:
+            fcntl.flock(lock_fh, fcntl.LOCK_UN)
+    return STORAGE_STATE_PATH
+
+
+@pytest.fixture(scope="session")
+def shared_context(browser: Browser, browser_context_args, warm_up_browser_cache):
+    """
+    Create one browser context per session (per xdist worker).
+    Context startup (~500ms) is amortized across the whole suite; each
+    test still gets its own page and cookies are cleared between tests.
+    The storage state primed by warm_up_browser_cache is reused so
+    navigations start warm. Tests needing a pristine context should use
+    the isolated_page fixture instead.
+    """
+    context_args = dict(browser_context_args)
+    if warm_up_browser_cache.exists():
+        context_args["storage_state"] = str(warm_up_browser_cache)
+
+    context = browser.new_context(**context_args)
+
+    # Pre-register the performance collector on every page so perf
+    # tests invoke it by name instead of shipping the JS source
+    from utils.performance import PERF_INIT_JS
+    context.add_init_script(PERF_INIT_JS)
+
+    # Drop known third-party analytics/ads requests: they add seconds
+    # of blocking load time and make perf measurements nondeterministic
+    context.route(THIRD_PARTY_BLOCKLIST, lambda route: route.abort())
+
+    yield context
+
+    context.close()
+
+
 @pytest.fixture(scope="function")
-def page(browser: Browser, browser_context_args) -> Page:
+def page(shared_context, request) -> Page:
     """
-    Create a new page for each test.
-    Automatically handles cleanup and screenshots on failure.
+    Create a new page for each test in the class-shared context.
+    Non-essential resources (see BLOCKED_RESOURCE_TYPES) are aborted
+    unless the test is marked @pytest.mark.needs_assets.
+    Cookies are cleared between tests so state doesn't leak.
     """
-    context = browser.new_context(**browser_context_args)
-    page = context.new_page()
+    page = shared_context.new_page()
+
+    if "needs_assets" not in request.keywords:
+        page.route(
+            "**/*",
+            lambda route: route.abort()
+            if route.request.resource_type in BLOCKED_RESOURCE_TYPES
+            else route.continue_()
+        )
 
     yield page
 
     # Cleanup
     page.close()
+    shared_context.clear_cookies()
+
+
+@pytest.fixture(scope="function")
+def isolated_page(browser: Browser, browser_context_args) -> Page:
+    """
+    Page in its own throwaway context, for tests that must not share
+    cookies/localStorage with the session context. Slower — only use
+    when isolation actually matters.
+    """
+    context = browser.new_context(**browser_context_args)
+    page = context.new_page()
+
+    yield page
+
+    # context.close() tears down its pages; no separate page.close() call
     context.close()
 
+
 @pytest.fixture(scope="function")
 def home_page(page: Page) -> HomePage:
     """
@@ -93,6 +276,40 @@ def why_multibank_page(page: Page) -> WhyMultibankPage:
     logger.info(f"Creating WhyMultibankPage object")
     return WhyMultibankPage(page)
 
+@pytest.fixture(scope="session")
+def session_home_page(shared_context) -> HomePage:
+    """
+    Home page loaded once per session, for tests that only read the
+    DOM. Mutating tests (clicks, tab switches) should stay on the
+    function-scoped loaded_home_page so they can't leak state here.
+    """
+    logger.info("Loading session-shared home page")
+    page = shared_context.new_page()
+    home = HomePage(page, BASE_URL)
+    home.load()
+
+    yield home
+
+    page.close()
+
+
+@pytest.fixture(scope="function")
+def loaded_why_multibank_page(why_multibank_page):
+    """
+    Fixture for WhyMultibankPage object that's already loaded.
+    Pages share the session context's HTTP cache, so loads after the
+    first skip most network cost.
+
+    Args:
+        why_multibank_page: WhyMultibankPage fixture
+
+    Returns:
+        WhyMultibankPage instance with page already loaded
+    """
+    logger.info("Auto-loading Why MultiBank page")
+    why_multibank_page.load()
+    return why_multibank_page
+
 @pytest.fixture(scope="function")
 def loaded_home_page(home_page):
     """
@@ -152,20 +369,25 @@ def pytest_runtest_makereport(item, call):
                 screenshot_name = f"FAILED_{item.name}"
 
                 try:
-                    from config.settings import SCREENSHOTS_DIR
-                    import allure
-
-                    screenshot_path = SCREENSHOTS_DIR / f"{screenshot_name}.png"
-                    page.screenshot(path=str(screenshot_path), full_page=True)
-                    logger.info(f"Screenshot saved: {screenshot_path}")
-
-                    # Attach screenshot to Allure report
-                    allure.attach.file(
-                        str(screenshot_path),
-                        name=screenshot_name,
-                        attachment_type=allure.attachment_type.PNG
-                    )
-                    logger.info(f"Screenshot attached to Allure report: {screenshot_name}")
+                    if item.config.getoption("--alluredir", None):
+                        # Allure run: attach the bytes directly, no disk
+                        # round-trip. Lazy import so non-Allure runs
+                        # never pay for it.
+                        import allure
+
+                        png_bytes = page.screenshot(full_page=False)
+                        allure.attach(
+                            png_bytes,
+                            name=screenshot_name,
+                            attachment_type=allure.attachment_type.PNG
+                        )
+                        logger.info(f"Screenshot attached to Allure report: {screenshot_name}")
+                    else:
+                        from config.settings import SCREENSHOTS_DIR, _ensure_dir
+
+                        screenshot_path = _ensure_dir(SCREENSHOTS_DIR) / f"{screenshot_name}.png"
+                        page.screenshot(path=str(screenshot_path), full_page=True)
+                        logger.info(f"Screenshot saved: {screenshot_path}")
 
                 except Exception as e:
                     logger.error(f"Failed to capture screenshot: {e}")
@@ -181,6 +403,8 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "cross_browser: Cross-browser tests")
     config.addinivalue_line("markers", "accessibility: Accessibility tests")
     config.addinivalue_line("markers", "performance: Performance tests")
+    config.addinivalue_line("markers", "needs_assets: Do not block images/CSS/fonts for this test")
+    config.addinivalue_line("markers", "serial: Must not run concurrently with other tests (run with -p no:xdist or -n 0)")
 
     # Set default browser from .env if not specified via command line
     if not config.option.browser:
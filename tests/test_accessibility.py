@@ -15,6 +15,7 @@ logger = logging.getLogger(__name__)
 class TestAccessibility:
     """Test suite for accessibility compliance."""
 
+    @pytest.mark.needs_assets
     def test_home_page_accessibility(self, loaded_home_page: HomePage):
         """
         Test homepage for accessibility violations.
@@ -53,22 +54,23 @@ class TestAccessibility:
 
         logger.info("✓ No critical accessibility violations found")
 
-    def test_why_multibank_page_accessibility(self, loaded_home_page: HomePage):
+    @pytest.mark.needs_assets
+    def test_why_multibank_page_accessibility(self, why_multibank_page):
         """
         Test Why Multibank page for accessibility violations.
 
         Test Steps:
-        1. Navigate to Why Multibank page
+        1. Load Why Multibank page directly (no menu traversal)
         2. Run axe-core accessibility checks
         3. Verify accessibility compliance
         """
         logger.info("Test: Checking trading section accessibility")
 
-        # Navigate to Why Multibank page
-        loaded_home_page.navigate_to_why_multibank()
+        # Direct navigation skips the home-page load and menu clicks
+        why_multibank_page.load()
 
         # Initialize accessibility checker
-        a11y = AccessibilityChecker(loaded_home_page.page)
+        a11y = AccessibilityChecker(why_multibank_page.page)
 
         # Run accessibility checks and assert no critical violations
         a11y.assert_no_critical_violations()
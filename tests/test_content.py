@@ -119,7 +119,7 @@ class TestContent:
         else:
             logger.warning("Google Play link not found on page")
 
-    def test_why_multibank_components_exist(self, why_multibank_page: WhyMultibankPage):
+    def test_why_multibank_components_exist(self, loaded_why_multibank_page: WhyMultibankPage):
         """
         Test that all expected components exist on Why MultiBank page.
 
@@ -132,8 +132,8 @@ class TestContent:
         """
         logger.info("Test: Why MultiBank page components exist")
 
-        # Load page
-        why_multibank_page.load()
+        # Page is pre-loaded by the fixture
+        why_multibank_page = loaded_why_multibank_page
 
         # Check hero carousel
         assert why_multibank_page.is_hero_carousel_visible(), \
@@ -162,7 +162,7 @@ class TestContent:
             "❌ Trading Opportunity section not found"
         logger.info("✓ Trading Opportunity section exists")
 
-    def test_why_multibank_content_text(self, why_multibank_page, test_data: dict):
+    def test_why_multibank_content_text(self, loaded_why_multibank_page, test_data: dict):
         """
         Test that h2 and h3 text content is correct on Why MultiBank page.
 
@@ -175,8 +175,8 @@ class TestContent:
         """
         logger.info("Test: Why MultiBank page content text verification")
 
-        # Load page
-        why_multibank_page.load()
+        # Page is pre-loaded by the fixture
+        why_multibank_page = loaded_why_multibank_page
 
         # Verify all content using helper method
         expected = test_data['why_multibank']['content']
@@ -186,9 +186,17 @@ class TestContent:
         assert results['passed'], \
             f"❌ Content verification failed:\n" + "\n".join(f"  - {err}" for err in results['errors'])
 
-        logger.info("✓ All Why MultiBank page content text is correct")
-        logger.info(f"  - Hero slides: {results['details']['hero_slides']}")
-        logger.info(f"  - Advantages subtitle: '{results['details']['advantages_subtitle']}'")
-        logger.info(f"  - Advantages title: '{results['details']['advantages_title']}'")
-        logger.info(f"  - Advantage cards: {results['details']['advantage_cards']}")
-        logger.info(f"  - Trading opportunity: '{results['details']['trading_opportunity']}'")
+        # One lazy %-formatted record instead of five separate emits
+        logger.info(
+            "✓ All Why MultiBank page content text is correct\n"
+            "  - Hero slides: %s\n"
+            "  - Advantages subtitle: '%s'\n"
+            "  - Advantages title: '%s'\n"
+            "  - Advantage cards: %s\n"
+            "  - Trading opportunity: '%s'",
+            results['details']['hero_slides'],
+            results['details']['advantages_subtitle'],
+            results['details']['advantages_title'],
+            results['details']['advantage_cards'],
+            results['details']['trading_opportunity'],
+        )
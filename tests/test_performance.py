@@ -10,27 +10,43 @@ from utils.performance import PerformanceChecker
 logger = logging.getLogger(__name__)
 
 
+@pytest.fixture(scope="class")
+def perf_snapshot(shared_context):
+    """
+    Load the home page once per class and collect every performance
+    metric in a single evaluate. The three tests consume slices of the
+    same snapshot instead of paying one page load + one round-trip each.
+    """
+    from config.settings import BASE_URL
+
+    page = shared_context.new_page()
+    home = HomePage(page, BASE_URL)
+    home.load()
+    # Ensure loadEventEnd is populated before reading the navigation
+    # entry, otherwise page_load silently falls back to the DCL timing
+    page.wait_for_function("() => document.readyState === 'complete'", timeout=10000)
+    snapshot = PerformanceChecker(page).collect_all()
+    page.close()
+    return snapshot
+
+
 @pytest.mark.performance
 @pytest.mark.regression
 class TestPerformance:
     """Test suite for performance metrics."""
 
-    def test_home_page_load_time(self, loaded_home_page: HomePage):
+    def test_home_page_load_time(self, perf_snapshot: dict):
         """
         Test homepage loads within acceptable time.
 
         Test Steps:
-        1. Load home page
+        1. Load home page (shared class snapshot)
         2. Measure page load metrics
         3. Assert page loads within 10 seconds
         """
         logger.info("Test: Measuring homepage load time")
 
-        # Initialize performance checker
-        perf = PerformanceChecker(loaded_home_page.page)
-
-        # Measure page load
-        metrics = perf.measure_page_load()
+        metrics = perf_snapshot['load_metrics']
 
         # Assert page loads within 10 seconds
         page_load_ms = metrics.get('page_load', 0)
@@ -42,22 +58,18 @@ class TestPerformance:
 
         logger.info(f"✓ Homepage loaded in {page_load_seconds:.2f}s")
 
-    def test_home_page_time_to_interactive(self, loaded_home_page: HomePage):
+    def test_home_page_time_to_interactive(self, perf_snapshot: dict):
         """
         Test homepage becomes interactive quickly.
 
         Test Steps:
-        1. Load home page
+        1. Load home page (shared class snapshot)
         2. Measure time to interactive
         3. Assert TTI is within acceptable range
         """
         logger.info("Test: Measuring time to interactive")
 
-        # Initialize performance checker
-        perf = PerformanceChecker(loaded_home_page.page)
-
-        # Measure TTI
-        tti = perf.measure_time_to_interactive()
+        tti = perf_snapshot['tti_seconds']
 
         # Assert TTI within 6 seconds
         assert tti > 0, "❌ Time to interactive not measured"
@@ -66,22 +78,18 @@ class TestPerformance:
 
         logger.info(f"✓ Page interactive in {tti:.2f}s")
 
-    def test_resource_optimization(self, loaded_home_page: HomePage):
+    def test_resource_optimization(self, perf_snapshot: dict):
         """
         Test page resources are optimized.
 
         Test Steps:
-        1. Load home page
+        1. Load home page (shared class snapshot)
         2. Count loaded resources
         3. Verify reasonable resource counts
         """
         logger.info("Test: Checking resource optimization")
 
-        # Initialize performance checker
-        perf = PerformanceChecker(loaded_home_page.page)
-
-        # Get resource counts
-        resources = perf.get_resource_count()
+        resources = perf_snapshot['resource_counts']
 
         total = resources.get('total', 0)
         scripts = resources.get('scripts', 0)
@@ -97,4 +105,4 @@ class TestPerformance:
         logger.info(f"✓ Resource counts within acceptable limits")
         logger.info(f"  Total resources: {total}")
         logger.info(f"  Scripts: {scripts}")
-        logger.info(f"  Images: {images}")
\ No newline at end of file
+        logger.info(f"  Images: {images}")
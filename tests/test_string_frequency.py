@@ -149,5 +149,30 @@ def test_performance_large_string():
     assert "c:1000" in result
 
 
+try:
+    import pytest_benchmark  # noqa: F401
+    HAS_BENCHMARK = True
+except ImportError:
+    HAS_BENCHMARK = False
+
+
+@pytest.mark.skipif(not HAS_BENCHMARK, reason="pytest-benchmark not installed")
+@pytest.mark.parametrize("size", [1_000, 100_000, 1_000_000])
+def test_frequency_benchmark(benchmark, size):
+    """
+    Track the frequency counter's constant factor across input sizes.
+    Correctness stays covered by test_performance_large_string; this
+    exists so a slowdown shows up in benchmark comparisons instead of
+    passing silently.
+    """
+    text = "abc" * (size // 3)
+
+    # Call the undecorated function: timing through the lru_cache wrapper
+    # would measure a cache hit from the second round onwards
+    result = benchmark(count_character_frequency.__wrapped__, text)
+
+    assert f"a:{size // 3}" in result
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
@@ -9,46 +9,62 @@ from pages.home_page import HomePage
 logger = logging.getLogger(__name__)
 
 
+@pytest.fixture(scope="class")
+def spot_trading_page(shared_context):
+    """
+    Home page navigated to the Spot Trade section once per class.
+    All three trading tests read from the same section, so sharing the
+    navigation drops two of the three page loads.
+    """
+    from config.settings import BASE_URL
+
+    page = shared_context.new_page()
+    home = HomePage(page, BASE_URL)
+    home.load()
+    home.navigate_to_spot_trading()
+
+    yield home
+
+    page.close()
+
+
 @pytest.mark.content
 @pytest.mark.regression
 class TestTrading:
     """Test suite for the trading functionality."""
 
-    def test_trade_spot_trading_categories_display(self, loaded_home_page: HomePage, test_data: dict):
+    def test_trade_spot_trading_categories_display(self, spot_trading_page: HomePage, test_data: dict):
         """
         Verify trading categories are matching
 
         Test Steps:
-        1. Navigate to home page
+        1. Navigate to home page (shared class fixture)
         2. Go to Spot Trade section
         3. Verify if trading category matches
         """
-        # Navigate to spot trading
         logger.info("Test: Verifying trading category names")
-        loaded_home_page.navigate_to_spot_trading()
 
         # Get visible categories
-        categories = loaded_home_page.get_trading_categories()
+        categories = spot_trading_page.get_trading_categories()
         expected_categories = test_data["trade"]["pair-categories"]
 
         assert categories == expected_categories, \
             f"Categories mismatch: expected {expected_categories}, got {categories}"
         logger.info("✓ Trading category names matching")
 
-    def test_trade_spot_trading_all_categories_count(self, loaded_home_page: HomePage, test_data: dict):
+    def test_trade_spot_trading_all_categories_count(self, spot_trading_page: HomePage, test_data: dict):
         """
         Verify all the trading categories are displayed and functional
 
         Test Steps:
-        1. Navigate to home page
+        1. Navigate to home page (shared class fixture)
         2. Go to Spot Trade section
         3. Iterate through each category: All, USDT, BTC, FIAT
         4. Verify each category displays exactly 10 trading pairs
         """
         logger.info("Test: Verifying trading pairs across all categories")
-        loaded_home_page.navigate_to_spot_trading()
 
-        category_counts = loaded_home_page.get_trading_pairs_count_by_category()
+        category_counts = spot_trading_page.get_trading_pairs_count_by_category()
         expected_categories = test_data["trade"]["pair-categories"]
 
         # Verify each category has exactly 10 trading pairs
@@ -64,19 +80,18 @@ class TestTrading:
 
         logger.info(f"✓ All categories verified: {category_counts}")
 
-    def test_trade_trading_pair_structure(self, loaded_home_page: HomePage, test_data: dict):
+    def test_trade_trading_pair_structure(self, spot_trading_page: HomePage, test_data: dict):
         """
         Verify trading pair data structure
 
         Test Steps:
-        1. Navigate to home page
+        1. Navigate to home page (shared class fixture)
         2. Go to Spot Trade section
         3. Get the trading pair data
         4. Verify the trading pair data structure
         """
-        loaded_home_page.navigate_to_spot_trading()
         # Get trading pairs
-        pairs = loaded_home_page.get_trading_pairs()
+        pairs = spot_trading_page.get_trading_pairs()
 
         # Verify we got some pairs
         assert len(pairs) > 0, "❌ No trading pairs found"
@@ -2,10 +2,29 @@
 Accessibility Testing Utilities
 Uses axe-core for WCAG compliance checks
 """
+import hashlib
 import logging
+from functools import lru_cache
+from pathlib import Path
+
+from utils.snapshot_cache import SnapshotCache
 
 logger = logging.getLogger(__name__)
 
+# Vendored axe bundle; when present it is injected inline instead of
+# fetching from the CDN on every checker construction
+AXE_BUNDLE_PATH = Path(__file__).resolve().parent.parent / "resources" / "js" / "axe.min.js"
+AXE_CDN_URL = "https://cdnjs.cloudflare.com/ajax/libs/axe-core/4.8.2/axe.min.js"
+
+
+@lru_cache(maxsize=1)
+def _axe_source() -> str | None:
+    """Read the vendored axe bundle once per process (None if absent)."""
+    try:
+        return AXE_BUNDLE_PATH.read_text()
+    except OSError:
+        return None
+
 
 class AccessibilityChecker:
     """Accessibility testing using axe-core."""
@@ -13,18 +32,33 @@ class AccessibilityChecker:
     def __init__(self, page):
         """Initialize with Playwright page."""
         self.page = page
+        self._cache = SnapshotCache()
         self._inject_axe()
 
     def _inject_axe(self):
-        """Inject axe-core library into the page."""
-        try:
-            # Inject axe-core from CDN
-            self.page.add_script_tag(
-                url="https://cdnjs.cloudflare.com/ajax/libs/axe-core/4.8.2/axe.min.js"
-            )
-            logger.info("✓ axe-core library injected")
-        except Exception as e:
-            logger.warning(f"Failed to inject axe-core: {e}")
+        """
+        Inject axe-core library into the page (once per page).
+        Failures raise immediately: swallowing them here only defers
+        the crash to every later axe.run call.
+        """
+        # Multiple checkers can wrap the same page; the marker makes
+        # re-injection (and any repeat fetch) a no-op
+        if getattr(self.page, "_axe_ready", False):
+            return
+
+        if self.page.evaluate("() => typeof window.axe !== 'undefined'"):
+            logger.debug("axe-core already present, skipping injection")
+            self.page._axe_ready = True
+            return
+
+        source = _axe_source()
+        if source is not None:
+            # Local bundle: no network fetch, no CDN variability
+            self.page.add_script_tag(content=source)
+        else:
+            self.page.add_script_tag(url=AXE_CDN_URL)
+        self.page._axe_ready = True
+        logger.info("✓ axe-core library injected")
 
     def check_page(self, url: str = None) -> dict:
         """
@@ -39,12 +73,30 @@ class AccessibilityChecker:
         if url:
             logger.info(f"Running accessibility checks on: {url}")
 
+        # Axe results are deterministic for a given DOM: hash the full
+        # markup (attributes and text included — axe findings depend on
+        # alt/aria/role, not just structure) and serve the cached result
+        # if nothing changed
+        dom_hash = None
+        try:
+            dom_signature = self.page.evaluate(
+                "() => document.documentElement.outerHTML"
+            )
+            dom_hash = hashlib.sha256(dom_signature.encode()).hexdigest()
+            cached = self._cache.get(self.page.url, dom_hash)
+            if cached is not None:
+                return cached
+        except Exception as e:
+            logger.warning(f"DOM hash for accessibility cache failed: {e}")
+
         try:
             # Run axe accessibility checks
+            # resultTypes: ['violations'] skips the passes/incomplete
+            # enumeration, which dominates axe runtime on heavy pages
             results = self.page.evaluate("""
                 () => {
                     return new Promise((resolve) => {
-                        axe.run().then(results => {
+                        axe.run(document, { resultTypes: ['violations'] }).then(results => {
                             resolve({
                                 violations: results.violations,
                                 passes: results.passes.length,
@@ -64,6 +116,9 @@ class AccessibilityChecker:
             else:
                 logger.info(f"✓ No accessibility violations found ({passes_count} checks passed)")
 
+            if dom_hash is not None:
+                self._cache.set(self.page.url, dom_hash, results)
+
             return results
 
         except Exception as e:
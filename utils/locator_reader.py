@@ -1,16 +1,33 @@
 import os
 import json
+from functools import lru_cache
+from types import MappingProxyType
 
 # Path to locators.json
 BASE_DIR = os.getcwd()
 LOCATORS_PATH = os.path.join(BASE_DIR, "resources/locators/locators.json")
 
+@lru_cache(maxsize=1)
+def _load(mtime):
+    """
+    Parse locators.json, keyed on the file's mtime so an edited file is
+    re-read on next access while an unchanged one is never re-parsed.
+    """
+    with open(LOCATORS_PATH, "rb") as file:
+        return MappingProxyType(json.loads(file.read()))
+
 def load_locators():
-    """Load locators.json file and return as a dictionary."""
+    """
+    Load locators.json (cached per mtime) and return a read-only view.
+    MappingProxyType guards the shared data against accidental mutation.
+    """
     if not os.path.exists(LOCATORS_PATH):
         raise FileNotFoundError(f"Locators file not found at: {LOCATORS_PATH}")
 
-    with open(LOCATORS_PATH, "r") as file:
-        return json.load(file)
+    return _load(os.path.getmtime(LOCATORS_PATH))
 
-LOCATORS = load_locators()
+def __getattr__(name):
+    """Lazy module attribute (PEP 562): parse only on first LOCATORS access."""
+    if name == "LOCATORS":
+        return load_locators()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,49 @@
+"""
+Logging Setup Utilities
+Routes log records through a queue so formatting and stream I/O happen
+on a background thread instead of blocking the test thread.
+"""
+import atexit
+import logging
+import logging.handlers
+import queue
+import sys
+from functools import lru_cache
+
+from config.settings import LOG_LEVEL
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+
+@lru_cache(maxsize=1)
+def setup_queue_logging() -> logging.handlers.QueueListener:
+    """
+    Install a QueueHandler on the root logger (once per process).
+
+    logger.info(...) then costs a lock-free queue put; a QueueListener
+    thread does the formatting and the synchronous stream write.
+
+    Returns:
+        The started QueueListener (stopped automatically at exit)
+    """
+    # UTF-8 stream so non-ASCII selectors/URLs never hit codec fallback
+    if hasattr(sys.stderr, "reconfigure"):
+        sys.stderr.reconfigure(encoding="utf-8")
+
+    log_queue = queue.SimpleQueue()
+
+    root = logging.getLogger()
+    root.setLevel(LOG_LEVEL)
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    listener = logging.handlers.QueueListener(
+        log_queue, stream_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
@@ -7,6 +7,65 @@ import time
 
 logger = logging.getLogger(__name__)
 
+# Combined collector as a plain function expression. Installed once per
+# context as window.__perfCollect (see PERF_INIT_JS / conftest), so each
+# collect_all call ships a ~30-byte invocation instead of this source.
+_COLLECT_FN = """
+    () => {
+        const perfData = performance.getEntriesByType('navigation')[0];
+
+        const safeDuration = (end, start) => {
+            if (!end || !start || end === 0 || start === 0) return 0;
+            return Math.round(end - start);
+        };
+
+        const load_metrics = {
+            dns_lookup: safeDuration(perfData.domainLookupEnd, perfData.domainLookupStart),
+            tcp_connect: safeDuration(perfData.connectEnd, perfData.connectStart),
+            request_time: safeDuration(perfData.responseStart, perfData.requestStart),
+            response_time: safeDuration(perfData.responseEnd, perfData.responseStart),
+            dom_load: safeDuration(perfData.domContentLoadedEventEnd, perfData.domContentLoadedEventStart),
+            dom_interactive: safeDuration(perfData.domInteractive, perfData.fetchStart),
+            first_paint: Math.round(performance.getEntriesByType('paint')[0]?.startTime || 0),
+            page_load: perfData.loadEventEnd && perfData.loadEventEnd > 0
+                ? Math.round(perfData.loadEventEnd - perfData.fetchStart)
+                : Math.round(perfData.domContentLoadedEventEnd - perfData.fetchStart)
+        };
+
+        const resources = performance.getEntriesByType('resource');
+        const counts = {
+            total: resources.length,
+            scripts: 0,
+            stylesheets: 0,
+            images: 0,
+            fonts: 0,
+            xhr: 0,
+            other: 0
+        };
+        const typeMap = {
+            script: 'scripts',
+            link: 'stylesheets',
+            css: 'stylesheets',
+            img: 'images',
+            font: 'fonts',
+            xmlhttprequest: 'xhr',
+            fetch: 'xhr'
+        };
+        for (const r of resources)
+            counts[typeMap[r.initiatorType] || 'other']++;
+
+        const tti_ms = (!perfData.domInteractive || perfData.domInteractive === 0)
+            ? Math.round(perfData.domContentLoadedEventEnd - perfData.fetchStart)
+            : Math.round(perfData.domInteractive - perfData.fetchStart);
+
+        return { load_metrics, resource_counts: counts, tti_ms };
+    }
+"""
+
+# Init script for BrowserContext.add_init_script: pre-registers the
+# collector on every page so later calls are a tiny invocation
+PERF_INIT_JS = f"window.__perfCollect = {_COLLECT_FN};"
+
 
 class PerformanceChecker:
     """Performance testing using Playwright metrics."""
@@ -15,6 +74,38 @@ class PerformanceChecker:
         """Initialize with Playwright page."""
         self.page = page
 
+    def collect_all(self) -> dict:
+        """
+        Collect load metrics, resource counts and TTI in one evaluate.
+        The three dedicated methods cost one CDP round-trip each; this
+        reads the navigation entry once and iterates the resource
+        entries once, returning everything together.
+
+        Returns:
+            Dict with 'load_metrics', 'resource_counts' and 'tti_seconds'
+        """
+        try:
+            # Tiny invocation when the init script registered the
+            # collector; ship the inline source only for contexts
+            # created without it
+            try:
+                combined = self.page.evaluate("() => window.__perfCollect()")
+            except Exception:
+                combined = self.page.evaluate(_COLLECT_FN)
+
+            combined['tti_seconds'] = combined.pop('tti_ms') / 1000
+            logger.info(
+                "Combined performance snapshot: load=%sms, tti=%.2fs, resources=%s",
+                combined['load_metrics']['page_load'],
+                combined['tti_seconds'],
+                combined['resource_counts']['total'],
+            )
+            return combined
+
+        except Exception as e:
+            logger.error(f"Failed to collect performance snapshot: {e}")
+            return {'load_metrics': {}, 'resource_counts': {}, 'tti_seconds': 0.0}
+
     def measure_page_load(self) -> dict:
         """
         Measure page load performance metrics.
@@ -103,14 +194,17 @@ class PerformanceChecker:
                         other: 0
                     };
                     
-                    resources.forEach(r => {
-                        if (r.initiatorType === 'script') counts.scripts++;
-                        else if (r.initiatorType === 'link' || r.initiatorType === 'css') counts.stylesheets++;
-                        else if (r.initiatorType === 'img') counts.images++;
-                        else if (r.initiatorType === 'font') counts.fonts++;
-                        else if (r.initiatorType === 'xmlhttprequest' || r.initiatorType === 'fetch') counts.xhr++;
-                        else counts.other++;
-                    });
+                    const typeMap = {
+                        script: 'scripts',
+                        link: 'stylesheets',
+                        css: 'stylesheets',
+                        img: 'images',
+                        font: 'fonts',
+                        xmlhttprequest: 'xhr',
+                        fetch: 'xhr'
+                    };
+                    for (const r of resources)
+                        counts[typeMap[r.initiatorType] || 'other']++;
                     
                     return counts;
                 }
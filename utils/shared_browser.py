@@ -0,0 +1,127 @@
+"""
+Shared Browser Endpoint Utilities
+Lets all xdist workers attach to one Chromium over CDP instead of each
+launching its own, cutting peak RAM/CPU on constrained CI runners.
+The first worker to acquire the lock spawns the browser process; a
+reference count in the state file lets the last worker out kill it.
+Opt-in via SHARED_BROWSER=true (Chromium only).
+"""
+import fcntl
+import json
+import logging
+import os
+import socket
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+CDP_PORT = int(os.getenv("SHARED_BROWSER_PORT", "9222"))
+CDP_ENDPOINT = f"http://localhost:{CDP_PORT}"
+
+_STATE_DIR = Path(tempfile.gettempdir()) / "multibank-shared-browser"
+_STATE_PATH = _STATE_DIR / "state.json"
+_LOCK_PATH = _STATE_DIR / "lock"
+
+_LAUNCH_TIMEOUT_S = 15
+
+
+class _StateLock:
+    """File lock guarding the shared state across worker processes."""
+
+    def __enter__(self):
+        _STATE_DIR.mkdir(parents=True, exist_ok=True)
+        self._fh = open(_LOCK_PATH, "w")
+        fcntl.flock(self._fh, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc):
+        fcntl.flock(self._fh, fcntl.LOCK_UN)
+        self._fh.close()
+
+
+def _read_state() -> dict:
+    try:
+        return json.loads(_STATE_PATH.read_text())
+    except Exception:
+        return {}
+
+
+def _write_state(state: dict):
+    _STATE_PATH.write_text(json.dumps(state))
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+        return True
+    except (OSError, TypeError):
+        return False
+
+
+def _wait_for_port(port: int, timeout: float = _LAUNCH_TIMEOUT_S):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with socket.create_connection(("localhost", port), timeout=1):
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"Shared browser did not open port {port} in {timeout}s")
+
+
+def acquire(executable_path: str) -> str:
+    """
+    Ensure the shared Chromium is running and register this worker.
+
+    Args:
+        executable_path: Chromium binary to spawn if not already running
+
+    Returns:
+        The CDP endpoint URL to connect_over_cdp against
+    """
+    with _StateLock():
+        state = _read_state()
+        if not _pid_alive(state.get("pid")):
+            user_data_dir = _STATE_DIR / "profile"
+            proc = subprocess.Popen(
+                [
+                    executable_path,
+                    "--headless=new",
+                    f"--remote-debugging-port={CDP_PORT}",
+                    f"--user-data-dir={user_data_dir}",
+                    "--no-first-run",
+                    "--disable-dev-shm-usage",
+                ],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            logger.info(f"Launched shared browser (pid {proc.pid}) on port {CDP_PORT}")
+            state = {"pid": proc.pid, "refs": 0}
+        state["refs"] = state.get("refs", 0) + 1
+        _write_state(state)
+    _wait_for_port(CDP_PORT)
+    return CDP_ENDPOINT
+
+
+def release():
+    """Deregister this worker; the last one out kills the browser."""
+    with _StateLock():
+        state = _read_state()
+        state["refs"] = max(0, state.get("refs", 1) - 1)
+        if state["refs"] == 0:
+            pid = state.get("pid")
+            if _pid_alive(pid):
+                logger.info(f"Stopping shared browser (pid {pid})")
+                try:
+                    os.kill(pid, 15)
+                except OSError as e:
+                    logger.warning(f"Failed to stop shared browser: {e}")
+            try:
+                _STATE_PATH.unlink()
+            except OSError:
+                pass
+        else:
+            _write_state(state)
@@ -0,0 +1,111 @@
+"""
+Snapshot Result Cache
+SQLite-backed cache for expensive, deterministic page analysis results
+(e.g. axe-core scans) keyed by URL + DOM structure hash. A page whose
+DOM hasn't changed since the last run gets its cached result back
+instead of paying for a full re-scan.
+"""
+import json
+import logging
+import sqlite3
+import time
+
+from config.settings import BASE_DIR, _ensure_dir
+
+logger = logging.getLogger(__name__)
+
+# Results older than this are considered stale and recomputed
+DEFAULT_TTL_SECONDS = 30 * 60
+
+_DB_PATH = BASE_DIR / ".pw-storage" / "snapshot_cache.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    cache_key TEXT PRIMARY KEY,
+    url TEXT,
+    dom_hash TEXT,
+    data BLOB,
+    ts INTEGER
+)
+"""
+
+
+class SnapshotCache:
+    """TTL cache for per-page analysis results keyed on (url, dom_hash)."""
+
+    def __init__(self, ttl_seconds: int = DEFAULT_TTL_SECONDS):
+        """
+        Open (creating if needed) the cache database.
+
+        Args:
+            ttl_seconds: Maximum age before a cached entry is ignored
+        """
+        self.ttl_seconds = ttl_seconds
+        _ensure_dir(_DB_PATH.parent)
+        self._conn = sqlite3.connect(str(_DB_PATH))
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+    @staticmethod
+    def _key(url: str, dom_hash: str) -> str:
+        return f"{url}::{dom_hash}"
+
+    def get(self, url: str, dom_hash: str) -> dict | None:
+        """
+        Look up a cached result.
+
+        Args:
+            url: Page URL the result was computed for
+            dom_hash: Hash of the page's DOM structure
+
+        Returns:
+            The cached dict, or None on miss/stale entry
+        """
+        try:
+            row = self._conn.execute(
+                "SELECT data, ts FROM snapshots WHERE cache_key = ?",
+                (self._key(url, dom_hash),),
+            ).fetchone()
+            if row is None:
+                return None
+            data, ts = row
+            if time.time() - ts > self.ttl_seconds:
+                logger.debug(f"Snapshot cache entry for {url} is stale")
+                return None
+            logger.info(f"Snapshot cache hit for {url}")
+            return json.loads(data)
+        except Exception as e:
+            logger.warning(f"Snapshot cache read failed: {e}")
+            return None
+
+    def set(self, url: str, dom_hash: str, result: dict):
+        """
+        Store a result, replacing any previous entry for the same key.
+
+        Args:
+            url: Page URL the result was computed for
+            dom_hash: Hash of the page's DOM structure
+            result: JSON-serializable result to cache
+        """
+        try:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO snapshots "
+                "(cache_key, url, dom_hash, data, ts) VALUES (?, ?, ?, ?, ?)",
+                (
+                    self._key(url, dom_hash),
+                    url,
+                    dom_hash,
+                    json.dumps(result),
+                    int(time.time()),
+                ),
+            )
+            self._conn.commit()
+        except Exception as e:
+            logger.warning(f"Snapshot cache write failed: {e}")
+
+    def close(self):
+        """Close the underlying database connection."""
+        try:
+            self._conn.close()
+        except Exception:
+            pass
@@ -1,16 +1,44 @@
-import os
-import json
+import mmap
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
 
-# Path to test_data.json
-BASE_DIR = os.getcwd()
-TEST_DATA_PATH = os.path.join(BASE_DIR, "config/test_data.json")
+try:
+    # Optional: C-level parser that decodes bytes directly
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
 
-def load_test_data():
-    """Load test_data.json file and return as a dictionary."""
-    if not os.path.exists(TEST_DATA_PATH):
-        raise FileNotFoundError(f"Test data file not found at: {TEST_DATA_PATH}")
+# Path to test_data.json, anchored on this file rather than the
+# caller's working directory and resolved once at import
+TEST_DATA_PATH = str(Path(__file__).resolve().parent.parent / "config" / "test_data.json")
 
-    with open(TEST_DATA_PATH, "r") as file:
-        return json.load(file)
+@lru_cache(maxsize=1)
+def load_test_data():
+    """
+    Load test_data.json once per process and return a read-only view.
+    The cache means repeated calls never re-read or re-parse the file;
+    MappingProxyType guards the shared data against accidental mutation.
+    """
+    # No exists() pre-check: open() raises FileNotFoundError itself,
+    # saving the extra stat() and the check/open race
+    with open(TEST_DATA_PATH, "rb") as file:
+        # Map the file instead of read(): the parser sees the page cache
+        # directly, with no intermediate bytes copy when orjson is used
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)
+            try:
+                data = _loads(view)
+            except TypeError:
+                # stdlib json does not accept a buffer, only str/bytes
+                data = _loads(mm[:])
+            finally:
+                # The mapping cannot close while a view is exported
+                view.release()
+            return MappingProxyType(data)
 
-TEST_DATA = load_test_data()
+def __getattr__(name):
+    """Lazy module attribute (PEP 562): parse only on first TEST_DATA access."""
+    if name == "TEST_DATA":
+        return load_test_data()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")